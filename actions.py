@@ -1,9 +1,12 @@
 """Web of Things HTTP actions."""
+import functools
+import json
 import logging
 from typing import Any, Dict
 
 import aiohttp
 import async_timeout
+import voluptuous as vol
 
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
@@ -51,13 +54,17 @@ class WoTActionHandler:
         }
 
         if thing_description and "actions" in thing_description:
+            register = self.hass.services.async_register
+            create_handler = self._create_action_handler
+            build_schema = self._build_action_schema
+            prefix = f"{entry_id}_"
             for action_name, action_data in thing_description["actions"].items():
-                service_name = f"{entry_id}_{action_name}"
-                self.hass.services.async_register(
+                service_name = prefix + action_name
+                register(
                     "wot_http",
                     service_name,
-                    self._create_action_handler(entry_id, action_name),
-                    schema=self._build_action_schema(action_data),
+                    create_handler(entry_id, action_name),
+                    schema=build_schema(action_data),
                 )
                 _LOGGER.debug("Registered action service: %s", service_name)
 
@@ -178,55 +185,64 @@ class WoTActionHandler:
             # Non-JSON response is okay
             pass
 
-    def _build_action_schema(self, action_data: Dict[str, Any]):
+    def _build_action_schema(self, action_data: Dict[str, Any]) -> vol.Schema:
         """Build Home Assistant service schema from WoT action data."""
-        import voluptuous as vol
-        
-        if "input" not in action_data:
-            return vol.Schema({})
-
-        input_schema = action_data["input"]
-        if "properties" not in input_schema:
-            return vol.Schema({})
-
-        schema_dict = {}
-        properties = input_schema["properties"]
-
-        for prop_name, prop_data in properties.items():
-            prop_type = prop_data.get("type", "string")
-            required = prop_name in input_schema.get("required", [])
-
-            # Convert WoT types to voluptuous validators
-            if prop_type == "string":
-                validator = str
-            elif prop_type == "number":
-                validator = vol.Coerce(float)
-            elif prop_type == "integer":
-                validator = vol.Coerce(int)
-            elif prop_type == "boolean":
-                validator = bool
-            else:
-                validator = str
-
-            # Add constraints
-            if "minimum" in prop_data and "maximum" in prop_data:
-                validator = vol.All(validator, vol.Range(min=prop_data["minimum"], max=prop_data["maximum"]))
-            elif "minimum" in prop_data:
-                validator = vol.All(validator, vol.Range(min=prop_data["minimum"]))
-            elif "maximum" in prop_data:
-                validator = vol.All(validator, vol.Range(max=prop_data["maximum"]))
-
-            if "enum" in prop_data:
-                validator = vol.All(validator, vol.In(prop_data["enum"]))
-
-            # Add to schema
-            if required:
-                schema_dict[vol.Required(prop_name)] = validator
+        return _compile_action_schema(json.dumps(action_data, sort_keys=True))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_action_schema(action_json: str) -> vol.Schema:
+    """Compile a service schema from serialized WoT action data.
+
+    Cached on the serialized action so identical actions share one schema.
+    """
+    action_data = json.loads(action_json)
+
+    if "input" not in action_data:
+        return vol.Schema({})
+
+    input_schema = action_data["input"]
+    if "properties" not in input_schema:
+        return vol.Schema({})
+
+    schema_dict = {}
+    properties = input_schema["properties"]
+
+    for prop_name, prop_data in properties.items():
+        prop_type = prop_data.get("type", "string")
+        required = prop_name in input_schema.get("required", [])
+
+        # Convert WoT types to voluptuous validators
+        if prop_type == "string":
+            validator = str
+        elif prop_type == "number":
+            validator = vol.Coerce(float)
+        elif prop_type == "integer":
+            validator = vol.Coerce(int)
+        elif prop_type == "boolean":
+            validator = bool
+        else:
+            validator = str
+
+        # Add constraints
+        if "minimum" in prop_data and "maximum" in prop_data:
+            validator = vol.All(validator, vol.Range(min=prop_data["minimum"], max=prop_data["maximum"]))
+        elif "minimum" in prop_data:
+            validator = vol.All(validator, vol.Range(min=prop_data["minimum"]))
+        elif "maximum" in prop_data:
+            validator = vol.All(validator, vol.Range(max=prop_data["maximum"]))
+
+        if "enum" in prop_data:
+            validator = vol.All(validator, vol.In(prop_data["enum"]))
+
+        # Add to schema
+        if required:
+            schema_dict[vol.Required(prop_name)] = validator
+        else:
+            default = prop_data.get("default")
+            if default is not None:
+                schema_dict[vol.Optional(prop_name, default=default)] = validator
             else:
-                default = prop_data.get("default")
-                if default is not None:
-                    schema_dict[vol.Optional(prop_name, default=default)] = validator
-                else:
-                    schema_dict[vol.Optional(prop_name)] = validator
+                schema_dict[vol.Optional(prop_name)] = validator
 
-        return vol.Schema(schema_dict)
\ No newline at end of file
+    return vol.Schema(schema_dict)
@@ -1,4 +1,5 @@
 """HTTP utilities for WoT HTTP integration."""
+import re
 import ssl
 import functools
 import base64
@@ -10,6 +11,10 @@ import aiohttp
 from homeassistant.core import HomeAssistant
 from .const import AUTH_BASIC, AUTH_BEARER
 
+# Case-insensitive scheme prefixes, matched without lowercasing the whole href
+_HTTP_SCHEME_RE = re.compile(r'https?://', re.IGNORECASE)
+_WS_SCHEME_RE = re.compile(r'wss?://', re.IGNORECASE)
+
 
 async def create_http_session(
     hass: HomeAssistant, 
@@ -45,9 +50,10 @@ async def create_http_session(
     return aiohttp.ClientSession(connector=connector, headers=headers)
 
 
+@functools.lru_cache(maxsize=256)
 def resolve_url(base_url: str, href: str) -> str:
     """Resolve href to absolute URL."""
-    if href.lower().startswith(('http://', 'https://')):
+    if _HTTP_SCHEME_RE.match(href):
         return href
     elif href.startswith('/'):
         return f"{base_url.rstrip('/')}{href}"
@@ -79,7 +85,7 @@ def get_property_url(base_url: str, prop_name: str, prop_info: dict) -> str:
         for form in prop_info["forms"]:
             if isinstance(form, dict) and "href" in form:
                 href = form["href"]
-                if not href.lower().startswith(('ws://', 'wss://')):
+                if not _WS_SCHEME_RE.match(href):
                     ops = form.get("op", [])
                     if "readproperty" in ops or not ops:
                         return resolve_url(base_url, href)
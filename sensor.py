@@ -137,39 +137,7 @@ class WoTDataUpdateCoordinator(DataUpdateCoordinator):
 
     def _get_property_url(self, prop_name: str, prop_info: dict) -> str:
         """Get the property URL from WoT 1.0 or 1.1 format."""
-        
-        # WoT 1.0 format - simple href
-        if "href" in prop_info:
-            href = prop_info['href']
-            return self._resolve_url(href)
-        
-        # WoT 1.1 format - forms array
-        if "forms" in prop_info and isinstance(prop_info["forms"], list):
-            for form in prop_info["forms"]:
-                if isinstance(form, dict) and "href" in form:
-                    # Look for HTTP-based forms (not WebSocket)
-                    href = form["href"]
-                    if not href.lower().startswith(('ws://', 'wss://')):
-                        # Check if this form supports readproperty operation
-                        ops = form.get("op", [])
-                        if "readproperty" in ops or not ops:  # If no ops specified, assume it supports read
-                            return self._resolve_url(href)
-        
-        # Fallback to default WoT endpoint
-        return f"{self.base_url}/properties/{prop_name}"
-
-    def _resolve_url(self, href: str) -> str:
-        """Resolve href to absolute URL."""
-        # Handle absolute URLs, relative paths, and relative URLs properly
-        if href.lower().startswith(('http://', 'https://')):
-            # Absolute URL - use as-is
-            return href
-        elif href.startswith('/'):
-            # Relative path from root - append to base URL
-            return f"{self.base_url}{href}"
-        else:
-            # Relative URL - append to base URL with separator
-            return f"{self.base_url}/{href}"
+        return get_property_url(self.base_url, prop_name, prop_info)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
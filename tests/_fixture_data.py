@@ -0,0 +1,64 @@
+"""Shared sample data for WoT HTTP component tests."""
+import json
+from types import MappingProxyType
+
+try:
+    # Installed alongside Home Assistant; the standalone tests fall back to json
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+_SAMPLE_TD_RAW = {
+    "@context": "https://www.w3.org/2019/wot/td/v1",
+    "title": "Test Device",
+    "properties": {
+        "temperature": {
+            "title": "Room Temperature",
+            "type": "number",
+            "unit": "celsius",
+            "readOnly": True,
+            "href": "/properties/temperature"
+        },
+        "brightness": {
+            "title": "Brightness Level",
+            "type": "number",
+            "minimum": 0,
+            "maximum": 100,
+            "href": "/properties/brightness"
+        }
+    },
+    "actions": {
+        "toggle": {
+            "description": "Toggle device on/off",
+            "href": "/actions/toggle"
+        },
+        "setBrightness": {
+            "description": "Set brightness level",
+            "input": {
+                "type": "object",
+                "properties": {
+                    "brightness": {
+                        "type": "number",
+                        "minimum": 0,
+                        "maximum": 100
+                    }
+                },
+                "required": ["brightness"]
+            },
+            "href": "/actions/setBrightness"
+        }
+    }
+}
+
+SAMPLE_TD_JSON = json.dumps(_SAMPLE_TD_RAW)
+
+SAMPLE_CONFIG_ENTRY_DATA = MappingProxyType({
+    "base_url": "http://192.168.1.100:8080",
+    "name": "Test WoT Device"
+})
+
+
+def decoded_sample_td():
+    """Return a fresh mutable copy, as decoded from an HTTP response body."""
+    return _loads(SAMPLE_TD_JSON)
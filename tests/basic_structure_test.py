@@ -5,25 +5,30 @@ import sys
 import os
 import traceback
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_COMPONENT_DIR = os.path.dirname(_HERE)
+_PARENT_DIR = os.path.dirname(_COMPONENT_DIR)
+
 # Handle imports for both local development and CI environments
 def set_up_import_path():
     """Set up import path to work in both local and CI environments."""
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    component_dir = os.path.dirname(current_dir)
-    
     # For CI: add the component directory directly to path
-    if component_dir not in sys.path:
-        sys.path.insert(0, component_dir)
+    if _COMPONENT_DIR not in sys.path:
+        sys.path.insert(0, _COMPONENT_DIR)
     
     # For local development: add parent directory for custom_components.wot_http
-    parent_dir = os.path.join(component_dir, '..')
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
+    if _PARENT_DIR not in sys.path:
+        sys.path.insert(0, _PARENT_DIR)
 
 set_up_import_path()
 
 def import_component_module(module_name):
     """Import a component module with fallback for CI environment."""
+    # Reuse modules already imported earlier in the session
+    for name in (f'custom_components.wot_http.{module_name}', module_name):
+        if name in sys.modules:
+            return sys.modules[name]
+    
     try:
         # Try local development import first
         return __import__(f'custom_components.wot_http.{module_name}', fromlist=[module_name])
@@ -35,7 +40,7 @@ def test_file_structure():
     """Test that all required files exist."""
     print("Testing file structure...")
     
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    base_dir = _COMPONENT_DIR
     required_files = [
         "manifest.json",
         "__init__.py",
@@ -68,7 +73,7 @@ def test_manifest_structure():
     
     try:
         import json
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        base_dir = _COMPONENT_DIR
         manifest_path = os.path.join(base_dir, "manifest.json")
         
         with open(manifest_path, 'r') as f:
@@ -117,7 +122,7 @@ def test_strings_structure():
     
     try:
         import json
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        base_dir = _COMPONENT_DIR
         strings_path = os.path.join(base_dir, "strings.json")
         
         with open(strings_path, 'r') as f:
@@ -146,7 +151,7 @@ def test_code_structure():
     print("\nTesting code structure...")
     
     try:
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        base_dir = _COMPONENT_DIR
         
         # Test __init__.py has required functions
         init_path = os.path.join(base_dir, "__init__.py")
@@ -202,15 +207,23 @@ def run_all_tests():
         test_code_structure,
     ]
     
-    passed = 0
-    total = len(tests)
-    
+    results = []
     for test in tests:
         try:
-            if test():
-                passed += 1
+            test()
+            results.append(None)
         except Exception as e:
-            print(f"✗ Test {test.__name__} failed with exception: {e}")
+            results.append(e)
+    
+    passed = 0
+    total = len(tests)
+    
+    for test, result in zip(tests, results):
+        if result is None:
+            passed += 1
+        else:
+            print(f"✗ Test {test.__name__} failed with exception: {result}")
+            traceback.print_exception(type(result), result, result.__traceback__)
     
     print(f"\n{'=' * 50}")
     print(f"Test Results: {passed}/{total} tests passed")
@@ -1,99 +1,152 @@
 """Global fixtures for WoT HTTP component tests."""
+import json
+import os
+
+import aiohttp
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock
 from aiohttp import ClientResponse
 
-# Import the Home Assistant testing framework fixtures only for integration tests
-# pytest_plugins = "pytest_homeassistant_custom_component"
+from ._fixture_data import SAMPLE_CONFIG_ENTRY_DATA, decoded_sample_td
+
+_DURATIONS_REPORT = "test-durations.json"
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Write per-test wall times, slowest first, for CI to check."""
+    if not os.environ.get("CI"):
+        return
+    durations: dict[str, float] = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            # Setup, call and teardown reports all count towards a test's time;
+            # collection reports and warnings have no per-test duration
+            if isinstance(report, pytest.TestReport):
+                durations[report.nodeid] = durations.get(report.nodeid, 0.0) + report.duration
+    path = config.invocation_params.dir / _DURATIONS_REPORT
+    ranked = sorted(durations.items(), key=lambda item: item[1], reverse=True)
+    path.write_text(json.dumps({nodeid: round(seconds, 4) for nodeid, seconds in ranked}, indent=2))
 
 
-# @pytest.fixture(autouse=True)  
-# def auto_enable_custom_integrations(enable_custom_integrations):
-#     """Enable custom integrations defined in the test dir."""
-#     yield
+def _make_json_response(status, payload=None, text=""):
+    """Return a new mock response with the given status, JSON body and text."""
+    body = json.dumps(payload)
+
+    async def _json(*args, **kwargs):
+        # Decode on every await, as aiohttp does, so callers never share a dict
+        return json.loads(body)
+
+    async def _text(*args, **kwargs):
+        return text
+
+    response = MagicMock(spec=ClientResponse)
+    response.status = status
+    response.json = _json
+    response.text = _text
+    return response
 
 
 @pytest.fixture
-def mock_setup_entry():
-    """Mock async_setup_entry."""
-    with patch(
-        "custom_components.wot_http.async_setup_entry",
-        return_value=True,
-    ) as mock_setup_entry:
-        yield mock_setup_entry
+def make_json_response():
+    """Factory for mock responses with a status, JSON body and text."""
+    return _make_json_response
 
 
 @pytest.fixture
 def mock_aiohttp_session():
     """Mock aiohttp session."""
-    with patch("aiohttp.ClientSession") as mock_session:
+    with patch.object(aiohttp, "ClientSession") as mock_session:
         yield mock_session
 
 
+async def _empty_json(*args, **kwargs):
+    """Return an empty JSON object body."""
+    return {}
+
+
+async def _empty_text(*args, **kwargs):
+    """Return an empty text body."""
+    return ""
+
+
+@pytest.fixture(scope="module")
+def mock_session_skeleton():
+    """Mock ClientSession instance reused by every test in a module."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_session_instance(mock_aiohttp_session, mock_session_skeleton):
+    """Return the shared session skeleton wired into the patched ClientSession."""
+    # Only drop the request methods' return values: resetting the session's
+    # own would discard the falsy __aexit__ result and swallow exceptions.
+    mock_session_skeleton.reset_mock(side_effect=True)
+    for method in ("get", "post", "request"):
+        getattr(mock_session_skeleton, method).reset_mock(return_value=True)
+    mock_aiohttp_session.return_value = mock_session_skeleton
+    return mock_session_skeleton
+
+
+class _RoutedResponse:
+    """Async context manager that yields a canned response."""
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response):
+        self._response = response
+
+    async def __aenter__(self):
+        return self._response
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def route_get(mock_session_instance):
+    """Route session.get() calls to responses by full URL.
+
+    Tests pass a ``{url: response}`` dict instead of a side_effect list,
+    so they do not depend on the order the component issues requests in.
+    A request for any other URL fails the test; pytest.fail raises an
+    outcome exception that the component's ``except Exception`` handlers
+    do not catch.
+    """
+    def _route(routes):
+        routed = {url: _RoutedResponse(response) for url, response in routes.items()}
+
+        def _get(url, *args, **kwargs):
+            response = routed.get(str(url))
+            if response is None:
+                pytest.fail(f"Unexpected GET {url}; routed URLs: {sorted(routed)}")
+            return response
+
+        mock_session_instance.get.side_effect = _get
+        return mock_session_instance
+
+    return _route
+
+
 @pytest.fixture
 def mock_response():
     """Mock aiohttp response."""
     response = MagicMock(spec=ClientResponse)
     response.status = 200
-    response.json = AsyncMock(return_value={})
-    response.text = AsyncMock(return_value="")
+    response.json = _empty_json
+    response.text = _empty_text
     return response
 
 
 @pytest.fixture
 def sample_thing_description():
-    """Sample WoT Thing Description."""
-    return {
-        "@context": "https://www.w3.org/2019/wot/td/v1",
-        "title": "Test Device",
-        "properties": {
-            "temperature": {
-                "title": "Room Temperature",
-                "type": "number",
-                "unit": "celsius",
-                "readOnly": True,
-                "href": "/properties/temperature"
-            },
-            "brightness": {
-                "title": "Brightness Level",
-                "type": "number",
-                "minimum": 0,
-                "maximum": 100,
-                "href": "/properties/brightness"
-            }
-        },
-        "actions": {
-            "toggle": {
-                "description": "Toggle device on/off",
-                "href": "/actions/toggle"
-            },
-            "setBrightness": {
-                "description": "Set brightness level",
-                "input": {
-                    "type": "object",
-                    "properties": {
-                        "brightness": {
-                            "type": "number",
-                            "minimum": 0,
-                            "maximum": 100
-                        }
-                    },
-                    "required": ["brightness"]
-                },
-                "href": "/actions/setBrightness"
-            }
-        }
-    }
+    """Sample WoT Thing Description as a fresh dict, as decoded from JSON."""
+    return decoded_sample_td()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config_entry_data():
-    """Sample config entry data."""
-    return {
-        "host": "192.168.1.100",
-        "port": 8080,
-        "name": "Test WoT Device"
-    }
+    """Sample config entry data, shared read-only across the session."""
+    return SAMPLE_CONFIG_ENTRY_DATA
 
 
 @pytest.fixture
@@ -0,0 +1,96 @@
+"""Fixtures for WoT HTTP tests that run inside the Home Assistant test harness.
+
+The ``hass`` fixture comes from pytest-homeassistant-custom-component, which
+registers itself as the ``homeassistant`` pytest plugin. Standalone tests in
+the parent directory run without it (``-p no:homeassistant``).
+"""
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+import pytest
+from unittest.mock import patch
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+import custom_components.wot_http as wot_http
+from custom_components.wot_http import sensor as wot_sensor
+from custom_components.wot_http.const import DOMAIN
+
+
+@dataclass(frozen=True)
+class FakeConfigEntry:
+    """Config entry stand-in; the component only reads entry_id and data."""
+
+    entry_id: str
+    data: Mapping[str, Any]
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations defined in the test dir."""
+    yield
+
+
+@pytest.fixture(autouse=True)
+def no_scheduled_refresh(monkeypatch):
+    """Keep coordinators from arming their update-interval timer.
+
+    Tests drive refreshes explicitly; a pending loop.call_at handle would
+    only linger until the hass fixture tears down.
+    """
+    monkeypatch.setattr(DataUpdateCoordinator, "_schedule_refresh", lambda self: None)
+
+
+@pytest.fixture(autouse=True)
+def clean_domain_data(hass):
+    """Start every test without wot_http data in hass.data.
+
+    Nothing is popped on teardown: config entries created by flow tests are
+    unloaded when the hass fixture stops, and unloading needs that data.
+    """
+    hass.data.pop(DOMAIN, None)
+
+
+@pytest.fixture
+def done_future(hass):
+    """Return a factory for futures already resolved on the hass loop.
+
+    A MagicMock returning one of these can stand in for a coroutine method
+    whose result is all the test cares about, without AsyncMock's
+    per-call coroutine bookkeeping.
+    """
+    def _done(value):
+        future = hass.loop.create_future()
+        future.set_result(value)
+        return future
+
+    return _done
+
+
+@pytest.fixture(scope="session")
+def wot_module():
+    """The wot_http component package."""
+    return wot_http
+
+
+@pytest.fixture(scope="session")
+def wot_sensor_module():
+    """The wot_http sensor platform module."""
+    return wot_sensor
+
+
+@pytest.fixture
+def mock_setup_entry():
+    """Mock async_setup_entry."""
+    with patch.object(
+        wot_http,
+        "async_setup_entry",
+        return_value=True,
+    ) as mock_setup_entry:
+        yield mock_setup_entry
+
+
+@pytest.fixture
+def make_config_entry():
+    """Return a factory for fake config entries with the given id and data."""
+    return FakeConfigEntry
@@ -1,12 +1,19 @@
 """Test the WoT HTTP actions functionality."""
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 import voluptuous as vol
 
 from homeassistant.core import ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 
-from custom_components.wot_http.actions import WoTActionHandler
+from custom_components.wot_http.actions import WoTActionHandler, _compile_action_schema
+
+
+@pytest.fixture(autouse=True)
+def clear_action_schema_cache():
+    """Clear the compiled action schema cache between tests."""
+    _compile_action_schema.cache_clear()
+    yield
+    _compile_action_schema.cache_clear()
 
 
 @pytest.fixture
@@ -47,14 +54,12 @@ async def test_register_device_with_actions(hass, action_handler, sample_thing_d
     entry_id = "test_entry_123"
     
     action_handler.register_device(
-        entry_id, "192.168.1.100", 8080, sample_thing_description
+        entry_id, "http://192.168.1.100:8080", sample_thing_description
     )
     
     # Verify device is registered
     assert entry_id in action_handler._devices
     device = action_handler._devices[entry_id]
-    assert device["host"] == "192.168.1.100"
-    assert device["port"] == 8080
     assert device["base_url"] == "http://192.168.1.100:8080"
     assert device["thing_description"] == sample_thing_description
     
@@ -75,7 +80,7 @@ async def test_register_device_without_actions(hass, action_handler):
     }
     
     action_handler.register_device(
-        entry_id, "192.168.1.101", 8080, thing_description
+        entry_id, "http://192.168.1.101:8080", thing_description
     )
     
     # Device should be registered but no services
@@ -89,7 +94,7 @@ async def test_unregister_device(hass, action_handler, sample_thing_description)
     
     # Register device first
     action_handler.register_device(
-        entry_id, "192.168.1.100", 8080, sample_thing_description
+        entry_id, "http://192.168.1.100:8080", sample_thing_description
     )
     
     assert hass.services.has_service("wot_http", f"{entry_id}_toggle")
@@ -102,21 +107,17 @@ async def test_unregister_device(hass, action_handler, sample_thing_description)
     assert not hass.services.has_service("wot_http", f"{entry_id}_toggle")
 
 
-async def test_execute_simple_action(hass, action_handler, sample_thing_description, mock_aiohttp_session):
+async def test_execute_simple_action(hass, action_handler, sample_thing_description, mock_aiohttp_session, make_json_response):
     """Test executing a simple action without parameters."""
     entry_id = "test_entry_simple"
     action_handler.register_device(
-        entry_id, "192.168.1.100", 8080, sample_thing_description
+        entry_id, "http://192.168.1.100:8080", sample_thing_description
     )
     
     # Mock HTTP response
-    mock_session_instance = AsyncMock()
-    mock_aiohttp_session.return_value.__aenter__.return_value = mock_session_instance
+    mock_session_instance = mock_aiohttp_session.return_value
     
-    mock_response = AsyncMock()
-    mock_response.status = 200
-    mock_response.json = AsyncMock(return_value={"result": "success"})
-    mock_session_instance.request.return_value.__aenter__.return_value = mock_response
+    mock_session_instance.request.return_value.__aenter__.return_value = make_json_response(200, {"result": "success"})
     
     # Create service call
     service_call = ServiceCall("wot_http", f"{entry_id}_toggle", {})
@@ -132,19 +133,16 @@ async def test_execute_simple_action(hass, action_handler, sample_thing_descript
     assert call_args[0][1] == "http://192.168.1.100:8080/actions/toggle"  # URL
 
 
-async def test_execute_action_with_parameters(hass, action_handler, sample_thing_description, mock_aiohttp_session):
+async def test_execute_action_with_parameters(hass, action_handler, sample_thing_description, mock_aiohttp_session, mock_response):
     """Test executing an action with parameters."""
     entry_id = "test_entry_params"
     action_handler.register_device(
-        entry_id, "192.168.1.100", 8080, sample_thing_description
+        entry_id, "http://192.168.1.100:8080", sample_thing_description
     )
     
     # Mock HTTP response
-    mock_session_instance = AsyncMock()
-    mock_aiohttp_session.return_value.__aenter__.return_value = mock_session_instance
+    mock_session_instance = mock_aiohttp_session.return_value
     
-    mock_response = AsyncMock()
-    mock_response.status = 200
     mock_session_instance.request.return_value.__aenter__.return_value = mock_response
     
     # Create service call with parameters
@@ -162,21 +160,17 @@ async def test_execute_action_with_parameters(hass, action_handler, sample_thing
     assert call_args[1]["json"] == {"brightness": 75}
 
 
-async def test_execute_action_http_error(hass, action_handler, sample_thing_description, mock_aiohttp_session):
+async def test_execute_action_http_error(hass, action_handler, sample_thing_description, mock_aiohttp_session, make_json_response):
     """Test action execution with HTTP error response."""
     entry_id = "test_entry_error"
     action_handler.register_device(
-        entry_id, "192.168.1.100", 8080, sample_thing_description
+        entry_id, "http://192.168.1.100:8080", sample_thing_description
     )
     
     # Mock HTTP error response
-    mock_session_instance = AsyncMock()
-    mock_aiohttp_session.return_value.__aenter__.return_value = mock_session_instance
+    mock_session_instance = mock_aiohttp_session.return_value
     
-    mock_response = AsyncMock()
-    mock_response.status = 500
-    mock_response.text = AsyncMock(return_value="Internal Server Error")
-    mock_session_instance.request.return_value.__aenter__.return_value = mock_response
+    mock_session_instance.request.return_value.__aenter__.return_value = make_json_response(500, text="Internal Server Error")
     
     # Create service call
     service_call = ServiceCall("wot_http", f"{entry_id}_toggle", {})
@@ -191,12 +185,11 @@ async def test_execute_action_connection_error(hass, action_handler, sample_thin
     """Test action execution with connection error."""
     entry_id = "test_entry_conn_error"
     action_handler.register_device(
-        entry_id, "192.168.1.100", 8080, sample_thing_description
+        entry_id, "http://192.168.1.100:8080", sample_thing_description
     )
     
     # Mock connection error
-    mock_session_instance = AsyncMock()
-    mock_aiohttp_session.return_value.__aenter__.return_value = mock_session_instance
+    mock_session_instance = mock_aiohttp_session.return_value
     mock_session_instance.request.side_effect = Exception("Connection failed")
     
     # Create service call
@@ -254,6 +247,16 @@ async def test_build_action_schema_with_parameters(action_handler, sample_action
         schema({})  # missing required field
 
 
+async def test_build_action_schema_cached(action_handler, sample_action_schema):
+    """Test that identical action data reuses the compiled schema."""
+    action_data = sample_action_schema["setBrightness"]
+    schema = action_handler._build_action_schema(action_data)
+
+    # An equal but distinct dict should hit the same cache entry
+    assert action_handler._build_action_schema(dict(action_data)) is schema
+    assert _compile_action_schema.cache_info().hits == 1
+
+
 async def test_build_action_schema_enum_constraint(action_handler):
     """Test building schema with enum constraint."""
     action_data = {
@@ -0,0 +1,134 @@
+"""Test the WoT HTTP config flow."""
+import pytest
+from aiohttp import ClientError
+
+from homeassistant import config_entries
+from homeassistant.const import CONF_NAME
+
+from custom_components.wot_http import config_flow
+from custom_components.wot_http.const import DOMAIN, CONF_BASE_URL, CONF_AUTH_TYPE, AUTH_NONE
+
+BASE_URL = "http://192.168.1.100:8080"
+
+
+async def test_form_user_success(hass, mock_setup_entry, route_get, make_json_response, sample_thing_description):
+    """Test we get the form and can create entry successfully."""
+    # Mock successful main endpoint and Thing Description responses
+    route_get({f"{BASE_URL}/": make_json_response(200), f"{BASE_URL}/.well-known/wot": make_json_response(200, sample_thing_description)})
+    
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == "form"
+    assert result["errors"] == {}
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_BASE_URL: "http://192.168.1.100:8080",
+            CONF_NAME: "Test Device",
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result2["type"] == "create_entry"
+    assert result2["title"] == "Test Device"
+    assert result2["data"] == {
+        CONF_BASE_URL: "http://192.168.1.100:8080/",
+        CONF_NAME: "Test Device",
+        CONF_AUTH_TYPE: AUTH_NONE,
+        "thing_description": sample_thing_description,
+    }
+
+
+async def test_form_user_cannot_connect(hass, mock_session_instance):
+    """Test we handle cannot connect error."""
+    # Mock connection error
+    mock_session_instance.get.side_effect = ClientError
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_BASE_URL: "http://192.168.1.100:8080",
+            CONF_NAME: "Test Device",
+        },
+    )
+
+    assert result2["type"] == "form"
+    assert result2["errors"] == {"base": "cannot_connect"}
+
+
+async def test_form_user_http_error(hass, mock_session_instance, make_json_response):
+    """Test we handle HTTP error responses."""
+    # Mock HTTP error response
+    mock_session_instance.get.return_value.__aenter__.return_value = make_json_response(404)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_BASE_URL: "http://192.168.1.100:8080",
+            CONF_NAME: "Test Device",
+        },
+    )
+
+    assert result2["type"] == "form"
+    assert result2["errors"] == {"base": "cannot_connect"}
+
+
+async def test_form_user_no_thing_description(hass, mock_setup_entry, route_get, make_json_response):
+    """Test successful setup without Thing Description."""
+    # Mock main endpoint success, TD endpoint failure
+    route_get({f"{BASE_URL}/": make_json_response(200), f"{BASE_URL}/.well-known/wot": make_json_response(404)})
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+
+    result2 = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {
+            CONF_BASE_URL: "http://192.168.1.100:8080",
+            CONF_NAME: "Test Device",
+        },
+    )
+
+    # Should still succeed without Thing Description
+    assert result2["type"] == "create_entry"
+    assert result2["title"] == "Test Device"
+
+
+async def test_validate_input_function(hass, route_get, make_json_response, sample_thing_description):
+    """Test the validate_input function directly."""
+    route_get({f"{BASE_URL}/": make_json_response(200), f"{BASE_URL}/.well-known/wot": make_json_response(200, sample_thing_description)})
+
+    data = {
+        CONF_BASE_URL: "http://192.168.1.100:8080",
+        CONF_NAME: "Test Device",
+    }
+
+    result = await config_flow.validate_input(hass, data)
+    
+    assert result == {"title": "Test Device"}
+    assert "thing_description" in data
+    assert data["thing_description"] == sample_thing_description
+
+
+async def test_validate_input_connection_error(hass, mock_session_instance):
+    """Test validate_input with connection error."""
+    mock_session_instance.get.side_effect = ClientError
+
+    data = {
+        CONF_BASE_URL: "http://192.168.1.100:8080",
+        CONF_NAME: "Test Device",
+    }
+
+    with pytest.raises(config_flow.CannotConnect):
+        await config_flow.validate_input(hass, data)
\ No newline at end of file
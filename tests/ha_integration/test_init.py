@@ -0,0 +1,205 @@
+"""Test the WoT HTTP component initialization."""
+import asyncio
+
+import aiohttp
+import pytest
+from unittest.mock import MagicMock, call, patch
+
+from homeassistant.const import CONF_NAME
+
+from custom_components.wot_http.const import DOMAIN, CONF_BASE_URL
+
+
+def assert_platforms_called(mock, entry, platforms=("sensor",)):
+    """Assert a platform setup/unload mock ran exactly once for entry."""
+    assert mock.call_args_list == [call(entry, list(platforms))]
+
+
+def assert_unregistered(handler, entry_id):
+    """Assert the action handler dropped entry_id exactly once."""
+    assert handler.unregister_device.call_args_list == [call(entry_id)]
+
+
+@pytest.fixture(autouse=True)
+def mock_platform_forwarding(hass, monkeypatch, done_future):
+    """Make platform setup and unload succeed without loading the sensor platform."""
+    monkeypatch.setattr(hass.config_entries, "async_forward_entry_setups", MagicMock(return_value=done_future(True)))
+    monkeypatch.setattr(hass.config_entries, "async_unload_platforms", MagicMock(return_value=done_future(True)))
+
+
+async def test_async_setup_no_config(hass, wot_module):
+    """Test async_setup with no configuration."""
+    result = await wot_module.async_setup(hass, {})
+    assert result is True
+
+
+async def test_async_setup_with_config(hass, wot_module):
+    """Test async_setup with configuration."""
+    config = {
+        DOMAIN: [
+            {
+                CONF_BASE_URL: "http://192.168.1.100:8080",
+                CONF_NAME: "Test Device"
+            }
+        ]
+    }
+    
+    with patch.object(hass.helpers.discovery, "async_load_platform") as mock_load_platform:
+        result = await wot_module.async_setup(hass, config)
+        
+        assert result is True
+        assert DOMAIN in hass.data
+        mock_load_platform.assert_called_once()
+
+
+async def test_async_setup_entry_success(hass, wot_module, make_config_entry, sample_config_entry_data, sample_thing_description, mock_session_instance, make_json_response):
+    """Test successful config entry setup."""
+    # Create fake config entry
+    config_entry = make_config_entry("test_entry_123", sample_config_entry_data)
+    
+    # Mock successful Thing Description fetch
+    mock_session_instance.get.return_value.__aenter__.return_value = make_json_response(200, sample_thing_description)
+    
+    result = await wot_module.async_setup_entry(hass, config_entry)
+    
+    assert result is True
+    assert DOMAIN in hass.data
+    assert config_entry.entry_id in hass.data[DOMAIN]
+    assert "action_handler" in hass.data[DOMAIN]
+    
+    # Verify platform setup was called
+    assert_platforms_called(hass.config_entries.async_forward_entry_setups, config_entry)
+
+
+async def test_async_setup_entry_no_thing_description(hass, wot_module, make_config_entry, sample_config_entry_data, mock_session_instance):
+    """Test config entry setup without Thing Description."""
+    config_entry = make_config_entry("test_entry_456", sample_config_entry_data)
+    
+    # Mock Thing Description fetch failure
+    mock_session_instance.get.side_effect = Exception("Connection failed")
+    
+    result = await wot_module.async_setup_entry(hass, config_entry)
+    
+    # Should still succeed without Thing Description
+    assert result is True
+    assert config_entry.entry_id in hass.data[DOMAIN]
+
+
+async def test_async_setup_entry_action_handler_reuse(hass, wot_module, make_config_entry, sample_config_entry_data, mock_session_instance):
+    """Test that action handler is reused across multiple entries."""
+    config_entry1 = make_config_entry("test_entry_1", sample_config_entry_data)
+    config_entry2 = make_config_entry("test_entry_2", sample_config_entry_data)
+    
+    mock_session_instance.get.side_effect = Exception("No TD")
+    
+    # Set up both entries concurrently, as Home Assistant does
+    await asyncio.gather(
+        wot_module.async_setup_entry(hass, config_entry1),
+        wot_module.async_setup_entry(hass, config_entry2),
+    )
+    
+    # A single handler should hold both devices
+    action_handler = hass.data[DOMAIN]["action_handler"]
+    assert config_entry1.entry_id in action_handler._devices
+    assert config_entry2.entry_id in action_handler._devices
+
+
+async def test_async_unload_entry_success(hass, wot_module, make_config_entry, sample_config_entry_data):
+    """Test successful config entry unload."""
+    # Setup entry first
+    config_entry = make_config_entry("test_entry_unload", sample_config_entry_data)
+    
+    # Add entry data and a mock action handler
+    mock_action_handler = MagicMock()
+    hass.data[DOMAIN] = {
+        config_entry.entry_id: config_entry.data,
+        "action_handler": mock_action_handler,
+    }
+    
+    result = await wot_module.async_unload_entry(hass, config_entry)
+    
+    assert result is True
+    assert config_entry.entry_id not in hass.data[DOMAIN]
+    
+    # Verify action handler cleanup was called
+    assert_unregistered(mock_action_handler, config_entry.entry_id)
+    
+    # Verify platform unload was called
+    assert_platforms_called(hass.config_entries.async_unload_platforms, config_entry)
+
+
+async def test_async_unload_entry_platform_failure(hass, wot_module, make_config_entry, sample_config_entry_data, done_future):
+    """Test config entry unload when platform unload fails."""
+    config_entry = make_config_entry("test_entry_fail", sample_config_entry_data)
+    
+    hass.data[DOMAIN] = {config_entry.entry_id: config_entry.data}
+    
+    hass.config_entries.async_unload_platforms.return_value = done_future(False)  # Platform unload failed
+    
+    result = await wot_module.async_unload_entry(hass, config_entry)
+    
+    assert result is False
+    # Entry data should not be removed if platform unload failed
+    assert config_entry.entry_id in hass.data[DOMAIN]
+
+
+async def test_async_unload_entry_no_action_handler(hass, wot_module, make_config_entry, sample_config_entry_data):
+    """Test config entry unload when no action handler exists."""
+    config_entry = make_config_entry("test_entry_no_handler", sample_config_entry_data)
+    
+    hass.data[DOMAIN] = {config_entry.entry_id: config_entry.data}
+    # Note: no action_handler in hass.data[DOMAIN]
+    
+    # Should not raise an exception
+    result = await wot_module.async_unload_entry(hass, config_entry)
+    
+    assert result is True
+    assert config_entry.entry_id not in hass.data[DOMAIN]
+
+
+async def test_domain_data_initialization(hass, wot_module, make_config_entry):
+    """Test that domain data is properly initialized."""
+    config_entry = make_config_entry("test_init", {
+        CONF_BASE_URL: "http://192.168.1.100:8080",
+        CONF_NAME: "Test Device"
+    })
+    
+    with patch.object(aiohttp, "ClientSession"):
+        await wot_module.async_setup_entry(hass, config_entry)
+    
+    # Verify domain data structure
+    assert DOMAIN in hass.data
+    assert isinstance(hass.data[DOMAIN], dict)
+    assert config_entry.entry_id in hass.data[DOMAIN]
+    assert "action_handler" in hass.data[DOMAIN]
+
+
+async def test_multiple_entries_same_domain(hass, wot_module, make_config_entry, mock_session_instance):
+    """Test handling multiple config entries for the same domain."""
+    entries_data = [
+        {CONF_BASE_URL: "http://192.168.1.100:8080", CONF_NAME: "Device 1"},
+        {CONF_BASE_URL: "http://192.168.1.101:8080", CONF_NAME: "Device 2"},
+    ]
+    
+    entries = []
+    for i, data in enumerate(entries_data):
+        config_entry = make_config_entry(f"test_entry_{i}", data)
+        entries.append(config_entry)
+    
+    mock_session_instance.get.side_effect = Exception("No TD")
+    
+    # Setup both entries concurrently
+    results = await asyncio.gather(*(wot_module.async_setup_entry(hass, entry) for entry in entries))
+    assert all(result is True for result in results)
+    
+    # Verify both entries are tracked
+    assert len([k for k in hass.data[DOMAIN].keys() if k != "action_handler"]) == 2
+    assert "action_handler" in hass.data[DOMAIN]
+    
+    # Unload one entry
+    result = await wot_module.async_unload_entry(hass, entries[0])
+    assert result is True
+    
+    # Verify only one entry remains
+    assert len([k for k in hass.data[DOMAIN].keys() if k != "action_handler"]) == 1
+    assert entries[1].entry_id in hass.data[DOMAIN]
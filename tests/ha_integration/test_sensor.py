@@ -0,0 +1,194 @@
+"""Test the WoT HTTP sensor platform."""
+import re
+
+import aiohttp
+import pytest
+from unittest.mock import patch, MagicMock
+
+from aioresponses import aioresponses
+from yarl import URL
+
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_NAME
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.setup import async_setup_component
+
+from custom_components.wot_http.const import DOMAIN, AUTH_NONE
+
+BASE_URL = "http://192.168.1.100:8080"
+
+
+async def test_coordinator_update_with_thing_description(hass, wot_sensor_module, sample_thing_description):
+    """Test coordinator data update with Thing Description."""
+    coordinator = wot_sensor_module.WoTDataUpdateCoordinator(hass, BASE_URL)
+    coordinator.thing_description = sample_thing_description
+
+    with aioresponses() as mocked:
+        # Mock property responses
+        mocked.get(f"{BASE_URL}/properties/temperature", payload={"value": 22.5})
+        mocked.get(f"{BASE_URL}/properties/brightness", payload={"value": 75})
+
+        result = await coordinator._async_update_data()
+
+    assert result["temperature"] == 22.5
+    assert result["brightness"] == 75
+    assert result["_thing_description"] == sample_thing_description
+
+
+async def test_coordinator_update_fallback_mode(hass, wot_sensor_module):
+    """Test coordinator fallback mode without Thing Description."""
+    coordinator = wot_sensor_module.WoTDataUpdateCoordinator(hass, BASE_URL)
+
+    with aioresponses() as mocked:
+        # Both Thing Description endpoints miss before /properties answers
+        mocked.get(f"{BASE_URL}/.well-known/wot", status=404)
+        mocked.get(f"{BASE_URL}/", status=404)
+        mocked.get(f"{BASE_URL}/properties", payload={"temperature": 23.0, "humidity": 60})
+
+        result = await coordinator._async_update_data()
+
+    assert result["temperature"] == 23.0
+    assert result["humidity"] == 60
+
+
+async def test_coordinator_update_connection_error(hass, wot_sensor_module):
+    """Test coordinator handling connection errors on every endpoint."""
+    coordinator = wot_sensor_module.WoTDataUpdateCoordinator(hass, BASE_URL)
+
+    with aioresponses() as mocked:
+        mocked.get(re.compile(rf"^{re.escape(BASE_URL)}/"), exception=aiohttp.ClientError("Connection failed"), repeat=True)
+
+        result = await coordinator._async_update_data()
+
+    # Per-endpoint failures are logged and skipped, leaving no data
+    assert result == {}
+    assert coordinator.thing_description is None
+
+
+async def test_coordinator_update_session_error(hass, wot_sensor_module):
+    """Test coordinator raising UpdateFailed when no session can be created."""
+    coordinator = wot_sensor_module.WoTDataUpdateCoordinator(hass, BASE_URL)
+
+    with patch.object(wot_sensor_module, "create_http_session", side_effect=aiohttp.ClientError("Connection failed")):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+
+@pytest.fixture
+def coordinator(hass, wot_sensor_module):
+    """Coordinator for sensor property tests."""
+    return wot_sensor_module.WoTDataUpdateCoordinator(hass, BASE_URL)
+
+
+@pytest.fixture
+def sensor_factory(wot_sensor_module, coordinator):
+    """Build numeric WoT sensors on the shared test coordinator."""
+    def _make(name, key, unit):
+        return wot_sensor_module.WoTSensor(
+            coordinator=coordinator,
+            name=name,
+            property_key=key,
+            data_type="number",
+            unit=unit
+        )
+
+    return _make
+
+
+@pytest.mark.parametrize(
+    "data,key,unit,last_ok,expected_value,expected_dc,expected_avail",
+    [
+        ({"temperature": 22.5, "brightness": 75}, "temperature", "°C", True, 22.5, "temperature", True),
+        ({"temperature": {"value": 22.5, "timestamp": "2023-01-01T00:00:00Z"}}, "temperature", "°C", True, 22.5, "temperature", True),
+        (None, "temperature", "°C", False, None, "temperature", False),
+        ({"humidity": 60, "pressure": 1013.25}, "humidity", "%", True, 60, "humidity", True),
+        ({"humidity": 60, "pressure": 1013.25}, "pressure", "hPa", True, 1013.25, "pressure", True),
+    ],
+    ids=["temperature", "nested-value", "unavailable", "humidity", "pressure"],
+)
+async def test_wot_sensor(coordinator, sensor_factory, data, key, unit, last_ok, expected_value, expected_dc, expected_avail):
+    """Test WoT sensor value, device class and availability."""
+    coordinator.data = data
+    coordinator.last_update_success = last_ok
+
+    sensor = sensor_factory(f"Test {key.title()}", key, unit)
+
+    assert sensor.name == f"Test {key.title()}"
+    assert sensor.native_value == expected_value
+    assert sensor.native_unit_of_measurement == unit
+    assert sensor.device_class == expected_dc
+    assert sensor.available is expected_avail
+
+
+async def test_async_setup_entry_with_thing_description(hass, wot_sensor_module, make_config_entry, sample_config_entry_data, sample_thing_description, done_future):
+    """Test sensor platform setup with Thing Description."""
+    # Create fake config entry
+    config_entry = make_config_entry("test_entry", sample_config_entry_data)
+
+    # Mock coordinator
+    with patch.object(wot_sensor_module, "WoTDataUpdateCoordinator") as mock_coordinator_class:
+        mock_coordinator = MagicMock()
+        mock_coordinator.async_config_entry_first_refresh.return_value = done_future(None)
+        mock_coordinator.base_url = BASE_URL
+        mock_coordinator.thing_description = sample_thing_description
+        mock_coordinator.data = sample_thing_description
+        mock_coordinator_class.return_value = mock_coordinator
+
+        # Mock entity addition
+        mock_add_entities = MagicMock()
+
+        await wot_sensor_module.async_setup_entry(hass, config_entry, mock_add_entities)
+
+        # Verify coordinator was created and refreshed
+        mock_coordinator_class.assert_called_once_with(
+            hass, BASE_URL, AUTH_NONE, None, None, None
+        )
+        mock_coordinator.async_config_entry_first_refresh.assert_called_once()
+
+        # Verify entities were added (2 properties in sample TD)
+        mock_add_entities.assert_called_once()
+        added_sensors = mock_add_entities.call_args[0][0]
+        assert len(added_sensors) == 2
+
+
+async def test_async_setup_entry_fallback_sensor(hass, wot_sensor_module, make_config_entry, sample_config_entry_data, done_future):
+    """Test sensor platform setup without Thing Description (fallback)."""
+    config_entry = make_config_entry("test_entry", sample_config_entry_data)
+
+    with patch.object(wot_sensor_module, "WoTDataUpdateCoordinator") as mock_coordinator_class:
+        mock_coordinator = MagicMock()
+        mock_coordinator.async_config_entry_first_refresh.return_value = done_future(None)
+        mock_coordinator.base_url = BASE_URL
+        mock_coordinator.thing_description = None
+        mock_coordinator.data = {}  # No Thing Description
+        mock_coordinator_class.return_value = mock_coordinator
+
+        mock_add_entities = MagicMock()
+
+        await wot_sensor_module.async_setup_entry(hass, config_entry, mock_add_entities)
+
+        # Verify fallback sensor was created
+        mock_add_entities.assert_called_once()
+        added_sensors = mock_add_entities.call_args[0][0]
+        assert len(added_sensors) == 1  # Single fallback sensor
+
+
+async def test_coordinator_thing_description_caching(hass, wot_sensor_module, sample_thing_description):
+    """Test that Thing Description is cached after first fetch."""
+    coordinator = wot_sensor_module.WoTDataUpdateCoordinator(hass, BASE_URL)
+
+    with aioresponses() as mocked:
+        # First call - fetch TD
+        mocked.get(f"{BASE_URL}/.well-known/wot", payload=sample_thing_description)
+        mocked.get(f"{BASE_URL}/properties/temperature", payload={"value": 22.5}, repeat=True)
+        mocked.get(f"{BASE_URL}/properties/brightness", payload={"value": 22.5}, repeat=True)
+
+        await coordinator._async_update_data()
+        assert coordinator.thing_description == sample_thing_description
+
+        # Second call - should not fetch TD again
+        await coordinator._async_update_data()
+
+    assert len(mocked.requests[("GET", URL(f"{BASE_URL}/.well-known/wot"))]) == 1
+
+    # TD should still be cached
+    assert coordinator.thing_description == sample_thing_description